@@ -18,6 +18,9 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.6",
+    extras_require={
+        "fast": ["numpy", "pybase64"],
+    },
     entry_points={
         "console_scripts": [
             "text-encode-decode=text_codec:main",
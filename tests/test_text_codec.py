@@ -0,0 +1,497 @@
+"""
+Tests for text_codec.py.
+
+Run from the repository root with: python -m unittest discover -s tests
+"""
+
+import base64
+import codecs
+import contextlib
+import html
+import io
+import random
+import sys
+import unittest
+import urllib.parse
+from unittest import mock
+
+import text_codec
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Base64Test(unittest.TestCase):
+    """Base64 results must not depend on whether pybase64 is installed."""
+
+    def test_round_trip(self):
+        for text in ['', 'Hello, World!', '🔐🚀 ünï', 'x' * 1000]:
+            encoded = text_codec.TextEncoder.base64_encode(text)
+            self.assertEqual(encoded, base64.b64encode(text.encode('utf-8')).decode('ascii'))
+            self.assertEqual(text_codec.TextEncoder.base64_decode(encoded), text)
+
+    def test_lenient_decoding_matches_stdlib(self):
+        for encoded in ['SGk=SGk=', 'SGVsbG8=garbage', 'SG k=', 'SGk=\n', 'S#Gk=']:
+            self.assertEqual(
+                text_codec.TextEncoder.base64_decode(encoded),
+                base64.b64decode(encoded).decode('utf-8'),
+            )
+
+    def test_invalid_padding_raises(self):
+        with self.assertRaises(ValueError):
+            text_codec.TextEncoder.base64_decode('SGk')
+
+
+@unittest.skipUnless(numpy, 'numpy is not installed')
+class NumpyEncodeTest(unittest.TestCase):
+    """The NumPy path must produce exactly what the lookup tables produce."""
+
+    SAMPLES = ['a', 'Hello, World!', '🔐🚀 ünï' * 50, ''.join(map(chr, range(256)))]
+
+    def encode_both(self, encode, text):
+        with mock.patch.object(text_codec, '_NUMPY_MIN_BYTES', 1 << 62):
+            expected = encode(text)
+        with mock.patch.object(text_codec, '_NUMPY_MIN_BYTES', 1), \
+                mock.patch.object(text_codec, '_NUMPY_IMPORT_MIN_BYTES', 1):
+            actual = encode(text)
+        return expected, actual
+
+    def test_binary_matches_lookup_table(self):
+        for text in self.SAMPLES:
+            expected, actual = self.encode_both(text_codec.TextEncoder.binary_encode, text)
+            self.assertEqual(actual, expected)
+
+    def test_octal_matches_lookup_table(self):
+        for text in self.SAMPLES:
+            expected, actual = self.encode_both(text_codec.TextEncoder.octal_encode, text)
+            self.assertEqual(actual, expected)
+
+    def test_random_bytes(self):
+        rng = random.Random(0)
+        text = bytes(rng.randrange(256) for _ in range(4096)).decode('latin-1')
+        for encode in (text_codec.TextEncoder.binary_encode, text_codec.TextEncoder.octal_encode):
+            expected, actual = self.encode_both(encode, text)
+            self.assertEqual(actual, expected)
+
+
+class Rot13Test(unittest.TestCase):
+    """ROT13 must match the standard library's rot_13 codec."""
+
+    def test_matches_codecs(self):
+        samples = [
+            '', 'Hello, World!', ''.join(map(chr, range(256))), 'Ünïcödé àçcénts',
+            'Привет мир', '日本語テキスト', '🔐🚀 emoji', 'Mixed ñ Ω 𝔘 text\n\t',
+        ]
+        for text in samples:
+            expected = codecs.encode(text, 'rot_13')
+            self.assertEqual(text_codec.TextEncoder.rot13_encode(text), expected)
+            self.assertEqual(text_codec.TextEncoder.rot13_decode(expected), text)
+
+
+class BinaryOctalDecodeTest(unittest.TestCase):
+    """Binary and octal decoding of canonical and free-form input."""
+
+    @staticmethod
+    def reference(encoded, base):
+        """The original per-group parser, as a baseline to compare with."""
+        return bytearray(int(group, base) for group in encoded.split())
+
+    def assertDecodesLikeReference(self, func, encoded, base):
+        try:
+            expected = bytes(self.reference(encoded, base))
+        except ValueError as e:
+            with self.assertRaises(ValueError) as cm:
+                func(encoded.encode('ascii'))
+            self.assertEqual(str(cm.exception), str(e))
+        else:
+            self.assertEqual(func(encoded.encode('ascii')), expected)
+
+    def test_round_trip_all_bytes(self):
+        data = bytes(range(256)) * 3
+        for encode, decode in [
+            (text_codec.binary_encode_bytes, text_codec.binary_decode_bytes),
+            (text_codec.octal_encode_bytes, text_codec.octal_decode_bytes),
+        ]:
+            self.assertEqual(decode(encode(data)), data)
+            self.assertEqual(decode(encode(data[:1])), data[:1])
+
+    def test_round_trip_text(self):
+        for text in ['Hi!', '🔐🚀 ünï', 'x' * 500]:
+            self.assertEqual(text_codec.binary_decode(text_codec.binary_encode(text)), text)
+            self.assertEqual(text_codec.octal_decode(text_codec.octal_encode(text)), text)
+
+    def test_empty_and_whitespace_only(self):
+        for encoded in ['', ' ', '\n', ' \t\r\n\x0b\x0c ']:
+            self.assertEqual(text_codec.binary_decode(encoded), '')
+            self.assertEqual(text_codec.octal_decode(encoded), '')
+            self.assertEqual(text_codec.binary_decode_bytes(encoded.encode()), b'')
+            self.assertEqual(text_codec.octal_decode_bytes(encoded.encode()), b'')
+
+    def test_separators(self):
+        for sep in [' ', '\t', '\n', '\r\n', '  ', ' \t ']:
+            with self.subTest(sep=sep):
+                self.assertEqual(text_codec.binary_decode(sep.join(['01001000', '01101001'])), 'Hi')
+                self.assertEqual(text_codec.octal_decode(sep.join(['110', '151'])), 'Hi')
+                self.assertEqual(text_codec.binary_decode(' ' + sep + '01001000' + sep), 'H')
+
+    def test_non_canonical_widths(self):
+        self.assertEqual(text_codec.binary_decode('1001000 1101001'), 'Hi')
+        self.assertEqual(text_codec.binary_decode('01001000 1101001'), 'Hi')
+        self.assertEqual(text_codec.octal_decode('0110 151'), 'Hi')
+        self.assertEqual(text_codec.octal_decode('77 101'), '?A')
+        self.assertEqual(text_codec.octal_decode('0 101'), '\x00A')
+        # Groups must be separated; run-together digits are one big group
+        with self.assertRaises(ValueError):
+            text_codec.binary_decode('0100100001101001')
+        with self.assertRaises(ValueError):
+            text_codec.octal_decode('110151')
+
+    def test_octal_high_digit(self):
+        self.assertEqual(text_codec.octal_decode_bytes(b'377 000 300'), b'\xff\x00\xc0')
+        for encoded in ['400', '101 400', '777', '8', '1 2 3 9']:
+            with self.assertRaises(ValueError):
+                text_codec.octal_decode_bytes(encoded.encode())
+
+    def test_matches_reference_parser(self):
+        rng = random.Random(1)
+        groups = {
+            2: lambda: rng.choice([format(rng.randrange(256), '08b'), '1', '0' * 9, '2', '0b1', '+1001000', '0000_001']),
+            8: lambda: rng.choice([format(rng.randrange(256), '03o'), '7', '400', '0377', '8', '+01', '0_1']),
+        }
+        funcs = {2: text_codec.binary_decode_bytes, 8: text_codec.octal_decode_bytes}
+        for base, group in groups.items():
+            for _ in range(500):
+                sep = rng.choice([' ', '  ', '\n', '\t', ' \r\n'])
+                encoded = sep.join(group() for _ in range(rng.randrange(6)))
+                with self.subTest(base=base, encoded=encoded):
+                    self.assertDecodesLikeReference(funcs[base], encoded, base)
+
+    def test_unicode_separators(self):
+        self.assertEqual(text_codec.binary_decode('01001000\xa001101001'), 'Hi')
+        self.assertEqual(text_codec.octal_decode('110\xa0151'), 'Hi')
+        self.assertEqual(text_codec.binary_decode('01001000\u3000\u300001101001'), 'Hi')
+
+    def test_signs_and_underscores_parsed_per_group(self):
+        self.assertEqual(text_codec.binary_decode('+1001000 0110_1001'), 'Hi')
+        self.assertEqual(text_codec.binary_decode_bytes(b'+1001000 0110_1001'), b'Hi')
+
+    def test_errors_quote_group_as_text(self):
+        with self.assertRaisesRegex(ValueError, "base 2: '2'"):
+            text_codec.binary_decode('01001000 2')
+        with self.assertRaisesRegex(ValueError, "base 2: '0100100x'"):
+            text_codec.binary_decode('01001000 0100100x')
+        with self.assertRaisesRegex(ValueError, "base 8: '9'"):
+            text_codec.octal_decode('9')
+        with self.assertRaisesRegex(ValueError, 'range'):
+            text_codec.octal_decode('777')
+
+
+class HexDecodeTest(unittest.TestCase):
+
+    def test_whitespace_between_pairs(self):
+        self.assertEqual(text_codec.hex_decode('48 69'), 'Hi')
+        self.assertEqual(text_codec.hex_decode_bytes(b'48 69'), b'Hi')
+
+    def test_bytes_errors_come_from_fromhex(self):
+        with self.assertRaisesRegex(ValueError, 'fromhex.*position 2'):
+            text_codec.hex_decode_bytes(b'48\xc2\xa0')
+
+
+class BytesApiTest(unittest.TestCase):
+    """The bytes API must agree with the str API and reject text-only codecs."""
+
+    BYTES_ENCODINGS = ['base64', 'base32', 'hex', 'ascii85', 'binary', 'octal']
+    TEXT_ENCODINGS = ['url', 'html', 'rot13']
+
+    def test_supports_bytes(self):
+        coder = text_codec.EncoderDecoder()
+        for name in self.BYTES_ENCODINGS:
+            self.assertTrue(coder.supports_bytes(name), name)
+        for name in self.TEXT_ENCODINGS + ['nope']:
+            self.assertFalse(coder.supports_bytes(name), name)
+
+    def test_matches_str_api(self):
+        coder = text_codec.EncoderDecoder()
+        data = bytes(range(256))
+        for name in self.BYTES_ENCODINGS:
+            with self.subTest(encoding=name):
+                encoded = coder.encode_bytes(data, name)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(coder.decode_bytes(encoded, name), data)
+                text = 'Hello, 🔐 ünï'
+                self.assertEqual(
+                    coder.encode_bytes(text.encode('utf-8'), name).decode('ascii'),
+                    coder.encode(text, name),
+                )
+                self.assertEqual(
+                    coder.decode_bytes(coder.encode(text, name).encode('ascii'), name),
+                    text.encode('utf-8'),
+                )
+
+    def test_unsupported_encodings_raise(self):
+        coder = text_codec.EncoderDecoder()
+        for name in self.TEXT_ENCODINGS + ['nope']:
+            with self.assertRaisesRegex(ValueError, f'Unsupported bytes encoding: {name}'):
+                coder.encode_bytes(b'x', name)
+            with self.assertRaisesRegex(ValueError, f'Unsupported bytes encoding: {name}'):
+                coder.decode_bytes(b'x', name)
+
+
+class UrlTest(unittest.TestCase):
+    """URL coding must match urllib.parse.quote/unquote."""
+
+    def test_matches_urllib(self):
+        samples = [
+            '', 'plain', 'a b&c=d/e?f', '🔐🚀 ünï', '100%', '%zz%4', '%E2%82', '%41%42',
+            'caf%C3%A9 %F0%9F%94%90', 'bad %FF%FE bytes', 'lone \ud800 %41', '%41\udcff',
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    text_codec.TextEncoder.url_decode(text), urllib.parse.unquote(text)
+                )
+                if '\ud800' not in text and '\udcff' not in text:
+                    self.assertEqual(
+                        text_codec.TextEncoder.url_encode(text), urllib.parse.quote(text)
+                    )
+
+
+class HtmlTest(unittest.TestCase):
+    """HTML escaping must match html.escape."""
+
+    def test_matches_html_escape(self):
+        samples = [
+            '', 'plain text', '<b>&amp;</b>', '"quoted" \'single\'', '&&&<<<>>>',
+            'a < b && c > "d"', '🔐 <ünï> &', ''.join(map(chr, range(128))),
+        ]
+        for text in samples:
+            self.assertEqual(text_codec.TextEncoder.html_encode(text), html.escape(text))
+            self.assertEqual(text_codec.TextEncoder.html_decode(html.escape(text)), text)
+
+
+class BatchTest(unittest.TestCase):
+    """encode_many/decode_many must match item-by-item encode/decode."""
+
+    def test_matches_single_calls_in_order(self):
+        coder = text_codec.EncoderDecoder()
+        texts = [f'item {i} 🔐 <&>' * (i % 5) for i in range(200)]
+        for name in text_codec._ENCODERS:
+            with self.subTest(encoding=name):
+                encoded = coder.encode_many(texts, name)
+                self.assertEqual(encoded, [coder.encode(text, name) for text in texts])
+                self.assertEqual(coder.decode_many(iter(encoded), name), texts)
+
+    def test_empty_batch(self):
+        coder = text_codec.EncoderDecoder()
+        self.assertEqual(coder.encode_many([], 'hex'), [])
+        self.assertEqual(coder.decode_many((), 'hex'), [])
+
+    def test_unsupported_encoding(self):
+        coder = text_codec.EncoderDecoder()
+        with self.assertRaisesRegex(ValueError, 'Unsupported encoding: nope'):
+            coder.encode_many(['x'], 'nope')
+        with self.assertRaisesRegex(ValueError, 'Unsupported encoding: nope'):
+            coder.decode_many(['x'], 'nope')
+
+
+class WarmUpTest(unittest.TestCase):
+
+    def test_does_not_import_numpy_by_default(self):
+        with mock.patch.object(text_codec, '_get_numpy') as get_numpy:
+            text_codec.warm_up()
+            get_numpy.assert_not_called()
+            text_codec.warm_up(numpy=True)
+            get_numpy.assert_called_once_with()
+
+    def test_without_numpy_installed(self):
+        # A None entry in sys.modules makes "import numpy" raise ImportError
+        with mock.patch.dict(sys.modules, {'numpy': None}), \
+                mock.patch.object(text_codec, '_numpy', None):
+            text_codec.warm_up()
+            text_codec.warm_up(numpy=True)
+            self.assertIs(text_codec._numpy, False)
+            self.assertEqual(text_codec.url_decode('a%20b'), 'a b')
+            self.assertEqual(text_codec.html_decode('&lt;'), '<')
+            with mock.patch.object(text_codec, '_NUMPY_MIN_BYTES', 1):
+                self.assertEqual(text_codec.binary_encode('Hi'), '01001000 01101001')
+
+
+class StreamEncodeTest(unittest.TestCase):
+    """Streamed CLI encoding must match encoding the stripped input at once."""
+
+    SAMPLES = [
+        '',
+        '   \n\t ',
+        'Hello, World!',
+        '  padded both sides \n\n',
+        'x\x1fy\x1f',
+        '\xa0\u3000 unicode whitespace \u2028\x85',
+        'x' + ' ' * 50 + 'y' + ' ' * 50,
+        'multi-byte 🔐🚀 ünï ' * 7,
+        '\x00\x00\x00\x00 zero groups \x00\x00\x00\x00',
+    ]
+
+    def stream(self, encoding, data, chunk_size, decoder=None):
+        encode, block_size = text_codec._STREAM_ENCODERS[encoding]
+        out = io.BytesIO()
+        text_codec._stream_encode(
+            encode, block_size, io.BytesIO(data), out, decoder, chunk_size
+        )
+        return out.getvalue()
+
+    def test_matches_one_shot_across_chunk_boundaries(self):
+        rng = random.Random(0)
+        samples = list(self.SAMPLES)
+        for _ in range(30):
+            samples.append(''.join(
+                rng.choice(['a', 'Z', ' ', '\n', '\t', '\xa0', 'é', '🔐', '\x00'])
+                for _ in range(rng.randrange(80))
+            ))
+        for encoding, (encode, _) in text_codec._STREAM_ENCODERS.items():
+            for text in samples:
+                expected = encode(text.strip().encode('utf-8'))
+                for chunk_size in (1, 2, 3, 5, 7, 64):
+                    with self.subTest(encoding=encoding, text=text, chunk_size=chunk_size):
+                        actual = self.stream(encoding, text.encode('utf-8'), chunk_size)
+                        self.assertEqual(actual, expected)
+
+    def test_decode_error_reports_offset_in_input(self):
+        data = b'a' * 1000 + b'\xff'
+        for chunk_size in (1, 7, 64):
+            with self.assertRaisesRegex(UnicodeError, 'byte 0xff in position 1000:'):
+                self.stream('base64', data, chunk_size)
+        data = b'  ' + 'é'.encode('utf-8') * 100 + b'\xe2\x82'
+        with self.assertRaisesRegex(UnicodeError, 'in position 202-203:'):
+            self.stream('hex', data, 5)
+
+    def test_encode_error_reports_offset_in_stripped_text(self):
+        decoder = codecs.getincrementaldecoder('utf-8')('surrogateescape')
+        data = b'  ' + b'ab ' * 100 + b'\xff'
+        with self.assertRaisesRegex(UnicodeError, "'\\\\udcff' in position 300:"):
+            self.stream('base32', data, 7, decoder)
+
+    def test_main_without_binary_stdio(self):
+        # Replaced stdin/stdout (no .buffer) fall back to reading and printing text
+        stdout = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['text_codec.py', '-e', 'base64']), \
+                mock.patch.object(sys, 'stdin', io.StringIO('  Hello \n')), \
+                contextlib.redirect_stdout(stdout):
+            text_codec.main()
+        self.assertEqual(stdout.getvalue(), 'SGVsbG8=\n')
+
+
+class CacheTest(unittest.TestCase):
+    """The shared result cache must stay small and serve every instance."""
+
+    def setUp(self):
+        text_codec.EncoderDecoder().cache_clear()
+
+    def test_shared_between_instances(self):
+        text_codec.EncoderDecoder().encode('token', 'base64')
+        text_codec.EncoderDecoder().encode('token', 'base64')
+        self.assertEqual(text_codec._cached_apply.cache_info().hits, 1)
+
+    def test_expansion_factors_bound_results(self):
+        for name, factor in text_codec._ENCODE_EXPANSION.items():
+            for char in ['\U0001F510', "'", '\x00', 'é']:
+                for count in (1, 3, 10):
+                    result = text_codec.EncoderDecoder().encode(char * count, name)
+                    # Allow a few characters of padding for the block codecs
+                    self.assertLessEqual(len(result), factor * count + 8, (name, char))
+
+    def test_large_results_not_cached(self):
+        coder = text_codec.EncoderDecoder()
+        coder.encode('\U0001F510' * 100, 'binary')
+        coder.decode('x' * (text_codec._CACHE_MAX_LEN + 1), 'rot13')
+        self.assertEqual(text_codec._cached_apply.cache_info().currsize, 0)
+
+    def test_disabled(self):
+        text_codec.EncoderDecoder(enable_cache=False).encode('token', 'hex')
+        self.assertEqual(text_codec._cached_apply.cache_info().currsize, 0)
+
+
+class MainTest(unittest.TestCase):
+    """The argparse-free fast path must behave exactly like the full CLI."""
+
+    def run_main(self, *argv, stdin=''):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        with mock.patch.object(sys, 'argv', ['text_codec.py', *argv]), \
+                mock.patch.object(sys, 'stdin', io.StringIO(stdin)), \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                text_codec.main()
+            except SystemExit as e:
+                code = e.code
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def assertSameAsArgparse(self, flag, encoding, text):
+        fast = self.run_main(flag, encoding, text)
+        # '--' and a trailing positional both keep main() off the fast path
+        self.assertEqual(fast, self.run_main(flag, encoding, '--', text))
+        self.assertEqual(fast, self.run_main(text, flag, encoding))
+        return fast
+
+    def test_fast_path_matches_argparse(self):
+        for name in text_codec._ENCODERS:
+            encoded = text_codec.EncoderDecoder().encode('Hello, 🔐!', name)
+            for flag in ('-e', '--encode'):
+                code, out, err = self.assertSameAsArgparse(flag, name, 'Hello, 🔐!')
+                self.assertEqual((code, out, err), (0, encoded + '\n', ''))
+            for flag in ('-d', '--decode'):
+                code, out, err = self.assertSameAsArgparse(flag, name, encoded)
+                self.assertEqual((code, out, err), (0, 'Hello, 🔐!\n', ''))
+
+    def test_errors_match_argparse(self):
+        code, out, err = self.assertSameAsArgparse('-d', 'base64', 'SGk')
+        self.assertEqual((code, out), (1, ''))
+        self.assertTrue(err.startswith('Error: '), err)
+
+    def test_unknown_encoding(self):
+        for flag in ('-e', '-d'):
+            code, out, err = self.assertSameAsArgparse(flag, 'nope', 'text')
+            self.assertEqual((code, out, err), (1, '', 'Error: Unsupported encoding: nope\n'))
+
+    def test_text_starting_with_dash(self):
+        # Without '--', argparse rejects option-like text; the fast path must too
+        code, out, err = self.run_main('-e', 'base64', '-x')
+        self.assertEqual((code, out), (2, ''))
+        self.assertIn('unrecognized arguments: -x', err)
+        self.assertEqual(self.run_main('-e', 'base64', '--', '-x'), (0, 'LXg=\n', ''))
+        self.assertEqual(self.run_main('-e', 'base64', '-5'), (0, 'LTU=\n', ''))
+
+
+class BinaryStdoutTest(unittest.TestCase):
+    """Output written to sys.stdout.buffer must match what print() would write."""
+
+    def run_main(self, *argv, stdin=b'', newline=None):
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8', newline=newline)
+        with mock.patch.object(sys, 'argv', ['text_codec.py', *argv]), \
+                mock.patch.object(sys, 'stdin', io.TextIOWrapper(io.BytesIO(stdin))), \
+                contextlib.redirect_stdout(stdout):
+            text_codec.main()
+        stdout.flush()
+        return stdout.buffer.getvalue()
+
+    def test_matches_print(self):
+        text = 'Hello, 🔐 ünï'
+        for name in text_codec._ENCODERS:
+            expected = (text_codec.EncoderDecoder().encode(text, name) + '\n').encode('utf-8')
+            self.assertEqual(self.run_main('-e', name, text), expected, name)
+            self.assertEqual(self.run_main('-e', name, '--', text), expected, name)
+            piped = self.run_main('-e', name, stdin=b'  ' + text.encode('utf-8') + b'\n')
+            self.assertEqual(piped, expected, name)
+
+    def test_platform_newline(self):
+        # A stdout that translates newlines, as on Windows, must get '\r\n'
+        for name in ('base64', 'binary', 'url'):
+            self.assertTrue(self.run_main('-e', name, 'hi', newline='\r\n').endswith(b'\r\n'))
+            self.assertTrue(
+                self.run_main('-e', name, stdin=b'hi', newline='\r\n').endswith(b'\r\n')
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
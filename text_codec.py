@@ -6,12 +6,657 @@ A comprehensive tool for encoding and decoding text using various encoding schem
 
 import base64
 import binascii
-import urllib.parse
-import html
+import functools
 import codecs
-import argparse
+import io
+import os
 import sys
-from typing import Union, Dict, Callable
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, Optional
+
+# Use pybase64's SIMD-accelerated Base64 codec when it is installed. Its
+# encoder matches the standard library byte for byte. Its lenient decoder does
+# not (it rejects data after padding, which the standard library ignores), so
+# it is only used in strict mode, with the standard library handling any input
+# that strict mode rejects.
+try:
+    import pybase64 as _pybase64
+except ImportError:
+    _pybase64 = None
+
+_b64encode = _pybase64.b64encode if _pybase64 is not None else base64.b64encode
+
+
+def _b64decode(encoded):
+    """Decode Base64 exactly as base64.b64decode does, via pybase64 when possible."""
+    if _pybase64 is not None:
+        try:
+            return _pybase64.b64decode(encoded, validate=True)
+        except ValueError:
+            pass
+    return base64.b64decode(encoded)
+
+
+# Precomputed per-byte representations for the binary and octal encoders.
+# Looking a byte up in a 256-entry tuple is much cheaper than calling
+# format() for every byte of the input.
+_BIN_LUT = tuple(format(i, '08b').encode('ascii') for i in range(256))
+_OCT_LUT = tuple(format(i, '03o').encode('ascii') for i in range(256))
+
+# Separators accepted between binary/octal groups (what bytes.split() uses)
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Translation tables mapping an octal digit to its value in the high, middle
+# and low bits of a byte. The three positions never overlap, so combining
+# them needs no carries.
+_OCT_HIGH = bytes(((i - 48) << 6) & 0xff if 48 <= i <= 51 else 0 for i in range(256))
+_OCT_MID = bytes((i - 48) << 3 if 48 <= i <= 55 else 0 for i in range(256))
+_OCT_LOW = bytes(i - 48 if 48 <= i <= 55 else 0 for i in range(256))
+
+# ROT13 translation table; applying it twice restores the original text.
+# The rest of Latin-1 is mapped to itself so that common accented text stays
+# on str.translate's fast path instead of missing the table per character.
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = _UPPER.lower()
+_ROT13 = {i: i for i in range(256)}
+_ROT13.update(str.maketrans(
+    _UPPER + _LOWER,
+    _UPPER[13:] + _UPPER[:13] + _LOWER[13:] + _LOWER[:13],
+))
+
+# NumPy is an optional accelerator for the binary and octal encoders. Once
+# loaded it beats the lookup tables from about 64 KiB of input, but importing
+# it costs about as much as encoding 1-2 MiB with the tables. So it is used
+# from 64 KiB only if something has already imported it, and imported here
+# only for inputs of 2 MiB or more. Importing this module never loads it.
+_NUMPY_MIN_BYTES = 64 * 1024
+_NUMPY_IMPORT_MIN_BYTES = 2 * 1024 * 1024
+_numpy = None
+
+
+def _get_numpy():
+    """
+    Return the numpy module, or None if it is not installed.
+
+    The import is attempted once; the result (including failure) is cached.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def _numpy_for(size: int):
+    """
+    Return the numpy module if it is worth using for an input of size bytes,
+    otherwise None.
+    """
+    if size < _NUMPY_MIN_BYTES:
+        return None
+    if size < _NUMPY_IMPORT_MIN_BYTES and 'numpy' not in sys.modules:
+        return None
+    return _get_numpy()
+
+
+def _join_columns(np, columns) -> bytes:
+    """
+    Append a space to each row of an (n, k) array of ASCII codes and return
+    the rows as one byte string, without the trailing space.
+    """
+    spaces = np.full((columns.shape[0], 1), 0x20, dtype=np.uint8)
+    return np.hstack((columns, spaces)).tobytes()[:-1]
+
+
+def _canonical_digits(encoded: bytes, width: int) -> Optional[bytes]:
+    """
+    Return the digits of encoded with separators removed, if it consists of
+    groups of exactly width characters separated by single whitespace
+    characters; otherwise return None.
+
+    Only C-level slicing and translate() calls are used, so no list of
+    tokens is materialised.
+    """
+    text = encoded.strip()
+    groups = (len(text) + 1) // (width + 1)
+    if not groups or len(text) != groups * (width + 1) - 1:
+        return None
+    # Every separator position must hold whitespace...
+    if text[width::width + 1].translate(None, _ASCII_WHITESPACE):
+        return None
+    # ...and every other position must not
+    digits = text.translate(None, _ASCII_WHITESPACE)
+    if len(digits) != groups * width:
+        return None
+    return digits
+
+
+def _decode_groups(encoded: str, base: int) -> bytes:
+    """
+    Parse whitespace-separated digit groups one int() call at a time.
+
+    This is the general path for binary/octal input that is not in canonical
+    form. It works on str so that any Unicode whitespace (e.g. NBSP from a
+    web page) separates groups and errors quote the offending group as text.
+    """
+    return bytes(bytearray(int(group, base) for group in encoded.split()))
+
+
+def base64_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to Base64.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        Base64 encoded bytes
+    """
+    return _b64encode(data)
+
+
+def base64_encode(text: str) -> str:
+    """
+    Encode text to Base64.
+
+    Base64 is like converting text into a secret code using only 64 characters (A-Z, a-z, 0-9, +, /).
+    It's commonly used in email attachments and data URLs.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        Base64 encoded string
+    """
+    return base64_encode_bytes(text.encode('utf-8')).decode('ascii')
+
+
+def base64_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode Base64 bytes.
+
+    Args:
+        encoded: Base64 encoded bytes
+
+    Returns:
+        Decoded bytes
+    """
+    return _b64decode(encoded)
+
+
+def base64_decode(encoded: str) -> str:
+    """
+    Decode Base64 text.
+
+    Args:
+        encoded: Base64 encoded string
+
+    Returns:
+        Decoded string
+    """
+    return base64_decode_bytes(encoded).decode('utf-8')
+
+
+def base32_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to Base32.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        Base32 encoded bytes
+    """
+    return base64.b32encode(data)
+
+
+def base32_encode(text: str) -> str:
+    """
+    Encode text to Base32.
+
+    Base32 is like Base64's cousin - it uses only 32 characters (A-Z and 2-7).
+    It's case-insensitive and often used in file sharing and authentication tokens.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        Base32 encoded string
+    """
+    return base32_encode_bytes(text.encode('utf-8')).decode('ascii')
+
+
+def base32_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode Base32 bytes.
+
+    Args:
+        encoded: Base32 encoded bytes
+
+    Returns:
+        Decoded bytes
+    """
+    return base64.b32decode(encoded)
+
+
+def base32_decode(encoded: str) -> str:
+    """
+    Decode Base32 text.
+
+    Args:
+        encoded: Base32 encoded string
+
+    Returns:
+        Decoded string
+    """
+    return base32_decode_bytes(encoded).decode('utf-8')
+
+
+def hex_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to hexadecimal.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        Hexadecimal bytes
+    """
+    # binascii's C loop outperforms lookup-table and bytes.translate
+    # interleaving variants at every input size, so there is no Python fallback
+    return binascii.hexlify(data)
+
+
+def hex_encode(text: str) -> str:
+    """
+    Encode text to hexadecimal.
+
+    Hex encoding is like representing each character as its numerical value in base 16.
+    It's commonly used in color codes, memory addresses, and cryptographic hashes.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        Hexadecimal string
+    """
+    return text.encode('utf-8').hex()
+
+
+def hex_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode hexadecimal bytes.
+
+    Args:
+        encoded: Hexadecimal bytes
+
+    Returns:
+        Decoded bytes
+    """
+    try:
+        return binascii.unhexlify(encoded)
+    except (binascii.Error, ValueError):
+        # latin-1 maps every byte to one character, so fromhex reports the
+        # same error and position as it would for the raw bytes
+        return bytes.fromhex(encoded.decode('latin-1'))
+
+
+def hex_decode(encoded: str) -> str:
+    """
+    Decode hexadecimal text.
+
+    Args:
+        encoded: Hexadecimal string
+
+    Returns:
+        Decoded string
+    """
+    try:
+        # binascii's strict parser is faster for contiguous hex digits
+        data = binascii.unhexlify(encoded)
+    except (binascii.Error, ValueError):
+        # bytes.fromhex also accepts whitespace between byte pairs
+        data = bytes.fromhex(encoded)
+    return data.decode('utf-8')
+
+
+def url_encode(text: str) -> str:
+    """
+    URL encode text.
+
+    URL encoding is like making text safe for web addresses - spaces become %20,
+    special characters get converted to %XX format. Essential for web development.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        URL encoded string
+    """
+    # Imported on first use to keep CLI start-up fast; later imports are free
+    import urllib.parse
+    return urllib.parse.quote_from_bytes(text.encode('utf-8'))
+
+
+def url_decode(encoded: str) -> str:
+    """
+    Decode URL encoded text.
+
+    Args:
+        encoded: URL encoded string
+
+    Returns:
+        Decoded string
+    """
+    if '%' not in encoded:
+        return encoded
+    import urllib.parse
+    try:
+        # Same result as unquote(), minus its per-segment str bookkeeping
+        return urllib.parse.unquote_to_bytes(encoded).decode('utf-8', 'replace')
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be encoded to bytes; unquote() keeps them
+        return urllib.parse.unquote(encoded)
+
+
+def html_encode(text: str) -> str:
+    """
+    HTML encode text.
+
+    HTML encoding is like making text safe for web pages - < becomes &lt;,
+    > becomes &gt;, etc. This prevents code injection and display issues.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        HTML encoded string
+    """
+    # Same output as html.escape(), but each replace() pass is skipped when
+    # its character is absent, which is the common case for most text.
+    # '&' must be handled first so the entities added below are not re-escaped.
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if "'" in text:
+        text = text.replace("'", '&#x27;')
+    return text
+
+
+def html_decode(encoded: str) -> str:
+    """
+    Decode HTML encoded text.
+
+    Args:
+        encoded: HTML encoded string
+
+    Returns:
+        Decoded string
+    """
+    # Imported on first use to keep CLI start-up fast; later imports are free
+    import html
+    return html.unescape(encoded)
+
+
+def rot13_encode(text: str) -> str:
+    """
+    Encode text using ROT13.
+
+    ROT13 is like a simple letter substitution cipher - each letter is replaced
+    by the letter 13 positions after it in the alphabet. It's its own inverse!
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        ROT13 encoded string
+    """
+    return text.translate(_ROT13)
+
+
+def rot13_decode(encoded: str) -> str:
+    """
+    Decode ROT13 text.
+
+    Args:
+        encoded: ROT13 encoded string
+
+    Returns:
+        Decoded string
+    """
+    return encoded.translate(_ROT13)
+
+
+def ascii85_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to ASCII85 (Base85).
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        ASCII85 encoded bytes
+    """
+    return base64.a85encode(data)
+
+
+def ascii85_encode(text: str) -> str:
+    """
+    Encode text to ASCII85 (Base85).
+
+    ASCII85 is like a more efficient cousin of Base64 - it uses 85 printable
+    ASCII characters and produces smaller output. Often used in PDF files.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        ASCII85 encoded string
+    """
+    return ascii85_encode_bytes(text.encode('utf-8')).decode('ascii')
+
+
+def ascii85_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode ASCII85 bytes.
+
+    Args:
+        encoded: ASCII85 encoded bytes
+
+    Returns:
+        Decoded bytes
+    """
+    return base64.a85decode(encoded)
+
+
+def ascii85_decode(encoded: str) -> str:
+    """
+    Decode ASCII85 text.
+
+    Args:
+        encoded: ASCII85 encoded string
+
+    Returns:
+        Decoded string
+    """
+    return ascii85_decode_bytes(encoded).decode('utf-8')
+
+
+def binary_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to binary representation.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        Binary digits as bytes (space-separated bytes)
+    """
+    np = _numpy_for(len(data))
+    if np is not None:
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        return _join_columns(np, bits.reshape(-1, 8) + 0x30)
+    return b' '.join([_BIN_LUT[byte] for byte in data])
+
+
+def binary_encode(text: str) -> str:
+    """
+    Encode text to binary representation.
+
+    Binary encoding is like translating text into the language of switches - 
+    each character becomes a series of 1s and 0s (on/off). It's the most 
+    fundamental way computers represent data internally.
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        Binary string (space-separated bytes)
+    """
+    return binary_encode_bytes(text.encode('utf-8')).decode('ascii')
+
+
+def binary_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode binary digits given as bytes.
+
+    Args:
+        encoded: Binary digits as bytes (space-separated bytes)
+
+    Returns:
+        Decoded bytes
+    """
+    digits = _canonical_digits(encoded, 8)
+    if digits is not None and not digits.translate(None, b'01'):
+        # Canonical 8-bit groups can be parsed as a single integer in one C call
+        return int(digits, 2).to_bytes(len(digits) // 8, 'big')
+    # Convert each binary string to a byte
+    return _decode_groups(encoded.decode('utf-8'), 2)
+
+
+def binary_decode(encoded: str) -> str:
+    """
+    Decode binary text.
+
+    Args:
+        encoded: Binary string (space-separated bytes)
+
+    Returns:
+        Decoded string
+    """
+    try:
+        data = encoded.encode('ascii')
+    except UnicodeEncodeError:
+        # Non-ASCII separators or digits need the str-level parser
+        return _decode_groups(encoded, 2).decode('utf-8')
+    return binary_decode_bytes(data).decode('utf-8')
+
+
+def octal_encode_bytes(data: bytes) -> bytes:
+    """
+    Encode bytes to octal representation.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        Octal digits as bytes (space-separated bytes)
+    """
+    np = _numpy_for(len(data))
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        shifts = np.array([6, 3, 0], dtype=np.uint8)
+        return _join_columns(np, ((arr[:, None] >> shifts) & 0x7) + 0x30)
+    return b' '.join([_OCT_LUT[byte] for byte in data])
+
+
+def octal_encode(text: str) -> str:
+    """
+    Encode text to octal representation.
+
+    Octal encoding is like binary's older sibling - instead of using just 0 and 1,
+    it uses digits 0-7. It's like counting on your fingers if you only had 8 fingers.
+    Historically used in Unix file permissions (e.g., chmod 755).
+
+    Args:
+        text: The string to encode
+
+    Returns:
+        Octal string (space-separated bytes)
+    """
+    return octal_encode_bytes(text.encode('utf-8')).decode('ascii')
+
+
+def octal_decode_bytes(encoded: bytes) -> bytes:
+    """
+    Decode octal digits given as bytes.
+
+    Args:
+        encoded: Octal digits as bytes (space-separated bytes)
+
+    Returns:
+        Decoded bytes
+    """
+    digits = _canonical_digits(encoded, 3)
+    if (digits is not None and not digits.translate(None, b'01234567')
+            and not digits[0::3].translate(None, b'0123')):
+        # Canonical 3-digit groups: map the 1st, 2nd and 3rd digit of every
+        # group to its bit position within the byte and merge them as integers
+        value = (
+            int.from_bytes(digits[0::3].translate(_OCT_HIGH), 'big')
+            | int.from_bytes(digits[1::3].translate(_OCT_MID), 'big')
+            | int.from_bytes(digits[2::3].translate(_OCT_LOW), 'big')
+        )
+        return value.to_bytes(len(digits) // 3, 'big')
+    # Convert each octal string to a byte
+    return _decode_groups(encoded.decode('utf-8'), 8)
+
+
+def octal_decode(encoded: str) -> str:
+    """
+    Decode octal text.
+
+    Args:
+        encoded: Octal string (space-separated bytes)
+
+    Returns:
+        Decoded string
+    """
+    try:
+        data = encoded.encode('ascii')
+    except UnicodeEncodeError:
+        # Non-ASCII separators or digits need the str-level parser
+        return _decode_groups(encoded, 8).decode('utf-8')
+    return octal_decode_bytes(data).decode('utf-8')
+
+
+def warm_up(numpy: bool = False) -> None:
+    """
+    Load and prime the codec dependencies that are otherwise loaded lazily.
+
+    To keep CLI start-up fast, the url and html codecs import their modules
+    on first use, and urllib builds its quoting tables on its first call.
+    Long-running programs that care about first-call latency can call this
+    once at start-up to pay those costs up front.
+
+    Args:
+        numpy: Also import NumPy, if it is installed, so that the binary and
+            octal encoders use it for inputs of 64 KiB or more. This costs
+            tens of milliseconds and memory, so it is off by default.
+    """
+    url_encode(' ')
+    url_decode('%20')
+    html_decode('&amp;')
+    if numpy:
+        _get_numpy()
 
 
 class TextEncoder:
@@ -21,388 +666,483 @@ class TextEncoder:
     Think of this class like a universal translator for different text formats - similar to how
     a Swiss Army knife has different tools for different tasks, this class has different methods
     for different encoding schemes.
+    
+    The methods are aliases of the module-level functions of the same name, kept
+    so that existing ``TextEncoder.base64_encode(...)`` style calls keep working.
     """
     
-    @staticmethod
-    def base64_encode(text: str) -> str:
-        """
-        Encode text to Base64.
-        
-        Base64 is like converting text into a secret code using only 64 characters (A-Z, a-z, 0-9, +, /).
-        It's commonly used in email attachments and data URLs.
-        
-        Args:
-            text: The string to encode
-            
-        Returns:
-            Base64 encoded string
-        """
-        return base64.b64encode(text.encode('utf-8')).decode('ascii')
+    base64_encode = staticmethod(base64_encode)
+    base64_decode = staticmethod(base64_decode)
+    base64_encode_bytes = staticmethod(base64_encode_bytes)
+    base64_decode_bytes = staticmethod(base64_decode_bytes)
+    base32_encode = staticmethod(base32_encode)
+    base32_decode = staticmethod(base32_decode)
+    base32_encode_bytes = staticmethod(base32_encode_bytes)
+    base32_decode_bytes = staticmethod(base32_decode_bytes)
+    hex_encode = staticmethod(hex_encode)
+    hex_decode = staticmethod(hex_decode)
+    hex_encode_bytes = staticmethod(hex_encode_bytes)
+    hex_decode_bytes = staticmethod(hex_decode_bytes)
+    url_encode = staticmethod(url_encode)
+    url_decode = staticmethod(url_decode)
+    html_encode = staticmethod(html_encode)
+    html_decode = staticmethod(html_decode)
+    rot13_encode = staticmethod(rot13_encode)
+    rot13_decode = staticmethod(rot13_decode)
+    ascii85_encode = staticmethod(ascii85_encode)
+    ascii85_decode = staticmethod(ascii85_decode)
+    ascii85_encode_bytes = staticmethod(ascii85_encode_bytes)
+    ascii85_decode_bytes = staticmethod(ascii85_decode_bytes)
+    binary_encode = staticmethod(binary_encode)
+    binary_decode = staticmethod(binary_decode)
+    binary_encode_bytes = staticmethod(binary_encode_bytes)
+    binary_decode_bytes = staticmethod(binary_decode_bytes)
+    octal_encode = staticmethod(octal_encode)
+    octal_decode = staticmethod(octal_decode)
+    octal_encode_bytes = staticmethod(octal_encode_bytes)
+    octal_decode_bytes = staticmethod(octal_decode_bytes)
+
+
+# Registry of supported encodings, built once and shared read-only by every
+# EncoderDecoder instance.
+_ENCODINGS: Mapping[str, Mapping[str, Callable]] = MappingProxyType({
+    'base64': MappingProxyType({
+        'encode': base64_encode,
+        'decode': base64_decode,
+        'encode_bytes': base64_encode_bytes,
+        'decode_bytes': base64_decode_bytes,
+        'description': 'Base64 encoding (RFC 4648)'
+    }),
+    'base32': MappingProxyType({
+        'encode': base32_encode,
+        'decode': base32_decode,
+        'encode_bytes': base32_encode_bytes,
+        'decode_bytes': base32_decode_bytes,
+        'description': 'Base32 encoding (RFC 4648)'
+    }),
+    'hex': MappingProxyType({
+        'encode': hex_encode,
+        'decode': hex_decode,
+        'encode_bytes': hex_encode_bytes,
+        'decode_bytes': hex_decode_bytes,
+        'description': 'Hexadecimal encoding'
+    }),
+    'url': MappingProxyType({
+        'encode': url_encode,
+        'decode': url_decode,
+        'description': 'URL/Percent encoding (RFC 3986)'
+    }),
+    'html': MappingProxyType({
+        'encode': html_encode,
+        'decode': html_decode,
+        'description': 'HTML entity encoding'
+    }),
+    'rot13': MappingProxyType({
+        'encode': rot13_encode,
+        'decode': rot13_decode,
+        'description': 'ROT13 substitution cipher'
+    }),
+    'ascii85': MappingProxyType({
+        'encode': ascii85_encode,
+        'decode': ascii85_decode,
+        'encode_bytes': ascii85_encode_bytes,
+        'decode_bytes': ascii85_decode_bytes,
+        'description': 'ASCII85/Base85 encoding'
+    }),
+    'binary': MappingProxyType({
+        'encode': binary_encode,
+        'decode': binary_decode,
+        'encode_bytes': binary_encode_bytes,
+        'decode_bytes': binary_decode_bytes,
+        'description': 'Binary representation (base 2)'
+    }),
+    'octal': MappingProxyType({
+        'encode': octal_encode,
+        'decode': octal_decode,
+        'encode_bytes': octal_encode_bytes,
+        'decode_bytes': octal_decode_bytes,
+        'description': 'Octal representation (base 8)'
+    })
+})
+
+# Flat views of the registry so each lookup costs a single dict probe
+_ENCODERS: Mapping[str, Callable] = MappingProxyType({
+    name: info['encode'] for name, info in _ENCODINGS.items()
+})
+_DECODERS: Mapping[str, Callable] = MappingProxyType({
+    name: info['decode'] for name, info in _ENCODINGS.items()
+})
+_BYTES_ENCODERS: Mapping[str, Callable] = MappingProxyType({
+    name: info['encode_bytes'] for name, info in _ENCODINGS.items()
+    if 'encode_bytes' in info
+})
+_BYTES_DECODERS: Mapping[str, Callable] = MappingProxyType({
+    name: info['decode_bytes'] for name, info in _ENCODINGS.items()
+    if 'decode_bytes' in info
+})
+_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    name: info['description'] for name, info in _ENCODINGS.items()
+})
+
+
+# EncoderDecoder memoises results in one cache shared by every instance, so
+# code that creates an EncoderDecoder per request still gets hits. Only
+# calls whose input and result are both at most _CACHE_MAX_LEN characters
+# are cached, which bounds the cache to about 1 MB for ASCII text.
+_CACHE_SIZE = 1024
+_CACHE_MAX_LEN = 512
+
+# Worst-case result characters per input character for each encoder, used
+# to skip caching inputs whose result could exceed _CACHE_MAX_LEN. A
+# character is at most 4 UTF-8 bytes; binary, for example, turns each byte
+# into 9 characters. Decoded text is never longer than its input.
+_ENCODE_EXPANSION = {
+    'base64': 6,
+    'base32': 7,
+    'hex': 8,
+    'url': 12,
+    'html': 6,
+    'rot13': 1,
+    'ascii85': 5,
+    'binary': 36,
+    'octal': 16,
+}
+_ENCODE_CACHE_LIMITS = MappingProxyType({
+    name: _CACHE_MAX_LEN // factor for name, factor in _ENCODE_EXPANSION.items()
+})
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _cached_apply(func: Callable, text: str) -> str:
+    """Call func on text, memoising the result."""
+    return func(text)
+
+
+class EncoderDecoder:
+    """
+    Main class that orchestrates encoding and decoding operations.
     
-    @staticmethod
-    def base64_decode(encoded: str) -> str:
-        """
-        Decode Base64 text.
-        
-        Args:
-            encoded: Base64 encoded string
-            
-        Returns:
-            Decoded string
-        """
-        return base64.b64decode(encoded).decode('utf-8')
+    This is like the conductor of an orchestra - it coordinates all the different
+    encoding methods and provides a unified interface to use them.
+    """
     
-    @staticmethod
-    def base32_encode(text: str) -> str:
+    def __init__(self, enable_cache: bool = True):
         """
-        Encode text to Base32.
-        
-        Base32 is like Base64's cousin - it uses only 32 characters (A-Z and 2-7).
-        It's case-insensitive and often used in file sharing and authentication tokens.
-        
         Args:
-            text: The string to encode
-            
-        Returns:
-            Base32 encoded string
+            enable_cache: Use the shared cache of results for short inputs.
+                Disable this when handling untrusted input.
         """
-        return base64.b32encode(text.encode('utf-8')).decode('ascii')
+        self.encoder = TextEncoder()
+        self.encodings = _ENCODINGS
+        self._encoders = _ENCODERS
+        self._decoders = _DECODERS
+        self._bytes_encoders = _BYTES_ENCODERS
+        self._bytes_decoders = _BYTES_DECODERS
+        self._descriptions = _DESCRIPTIONS
+        self.enable_cache = enable_cache
     
-    @staticmethod
-    def base32_decode(encoded: str) -> str:
+    def encode(self, text: str, encoding: str) -> str:
         """
-        Decode Base32 text.
+        Encode text using the specified encoding.
         
         Args:
-            encoded: Base32 encoded string
+            text: Text to encode
+            encoding: Encoding type (base64, hex, url, etc.)
             
         Returns:
-            Decoded string
-        """
-        return base64.b32decode(encoded).decode('utf-8')
-    
-    @staticmethod
-    def hex_encode(text: str) -> str:
-        """
-        Encode text to hexadecimal.
-        
-        Hex encoding is like representing each character as its numerical value in base 16.
-        It's commonly used in color codes, memory addresses, and cryptographic hashes.
-        
-        Args:
-            text: The string to encode
+            Encoded string
             
-        Returns:
-            Hexadecimal string
+        Raises:
+            ValueError: If encoding type is not supported
         """
-        return text.encode('utf-8').hex()
+        func = self._encoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        if self.enable_cache and len(text) <= _ENCODE_CACHE_LIMITS[encoding]:
+            return _cached_apply(func, text)
+        return func(text)
     
-    @staticmethod
-    def hex_decode(encoded: str) -> str:
+    def decode(self, text: str, encoding: str) -> str:
         """
-        Decode hexadecimal text.
+        Decode text using the specified encoding.
         
         Args:
-            encoded: Hexadecimal string
+            text: Text to decode
+            encoding: Encoding type (base64, hex, url, etc.)
             
         Returns:
             Decoded string
-        """
-        return bytes.fromhex(encoded).decode('utf-8')
-    
-    @staticmethod
-    def url_encode(text: str) -> str:
-        """
-        URL encode text.
-        
-        URL encoding is like making text safe for web addresses - spaces become %20,
-        special characters get converted to %XX format. Essential for web development.
-        
-        Args:
-            text: The string to encode
-            
-        Returns:
-            URL encoded string
-        """
-        return urllib.parse.quote(text)
-    
-    @staticmethod
-    def url_decode(encoded: str) -> str:
-        """
-        Decode URL encoded text.
-        
-        Args:
-            encoded: URL encoded string
             
-        Returns:
-            Decoded string
+        Raises:
+            ValueError: If encoding type is not supported
         """
-        return urllib.parse.unquote(encoded)
+        func = self._decoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        if self.enable_cache and len(text) <= _CACHE_MAX_LEN:
+            return _cached_apply(func, text)
+        return func(text)
     
-    @staticmethod
-    def html_encode(text: str) -> str:
+    def encode_many(self, texts: Iterable[str], encoding: str) -> List[str]:
         """
-        HTML encode text.
+        Encode a batch of texts, resolving the encoder only once.
         
-        HTML encoding is like making text safe for web pages - < becomes &lt;,
-        > becomes &gt;, etc. This prevents code injection and display issues.
+        Results bypass the memoisation cache.
         
         Args:
-            text: The string to encode
+            texts: Texts to encode
+            encoding: Encoding type (base64, hex, url, etc.)
             
         Returns:
-            HTML encoded string
-        """
-        return html.escape(text)
-    
-    @staticmethod
-    def html_decode(encoded: str) -> str:
-        """
-        Decode HTML encoded text.
-        
-        Args:
-            encoded: HTML encoded string
+            Encoded strings, in input order
             
-        Returns:
-            Decoded string
+        Raises:
+            ValueError: If encoding type is not supported
         """
-        return html.unescape(encoded)
+        func = self._encoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        return list(map(func, texts))
     
-    @staticmethod
-    def rot13_encode(text: str) -> str:
+    def decode_many(self, texts: Iterable[str], encoding: str) -> List[str]:
         """
-        Encode text using ROT13.
+        Decode a batch of texts, resolving the decoder only once.
         
-        ROT13 is like a simple letter substitution cipher - each letter is replaced
-        by the letter 13 positions after it in the alphabet. It's its own inverse!
+        Results bypass the memoisation cache.
         
         Args:
-            text: The string to encode
+            texts: Texts to decode
+            encoding: Encoding type (base64, hex, url, etc.)
             
         Returns:
-            ROT13 encoded string
-        """
-        return codecs.encode(text, 'rot_13')
-    
-    @staticmethod
-    def rot13_decode(encoded: str) -> str:
-        """
-        Decode ROT13 text.
-        
-        Args:
-            encoded: ROT13 encoded string
+            Decoded strings, in input order
             
-        Returns:
-            Decoded string
+        Raises:
+            ValueError: If encoding type is not supported
         """
-        return codecs.decode(encoded, 'rot_13')
+        func = self._decoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        return list(map(func, texts))
     
-    @staticmethod
-    def ascii85_encode(text: str) -> str:
+    def encode_bytes(self, data: bytes, encoding: str) -> bytes:
         """
-        Encode text to ASCII85 (Base85).
-        
-        ASCII85 is like a more efficient cousin of Base64 - it uses 85 printable
-        ASCII characters and produces smaller output. Often used in PDF files.
+        Encode bytes using the specified encoding, without any str conversion.
         
         Args:
-            text: The string to encode
+            data: Bytes to encode
+            encoding: Encoding type (base64, hex, binary, etc.)
             
         Returns:
-            ASCII85 encoded string
-        """
-        return base64.a85encode(text.encode('utf-8')).decode('ascii')
-    
-    @staticmethod
-    def ascii85_decode(encoded: str) -> str:
-        """
-        Decode ASCII85 text.
-        
-        Args:
-            encoded: ASCII85 encoded string
+            Encoded bytes
             
-        Returns:
-            Decoded string
+        Raises:
+            ValueError: If encoding type does not support bytes
         """
-        return base64.a85decode(encoded).decode('utf-8')
+        func = self._bytes_encoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported bytes encoding: {encoding}")
+        return func(data)
     
-    @staticmethod
-    def binary_encode(text: str) -> str:
+    def decode_bytes(self, data: bytes, encoding: str) -> bytes:
         """
-        Encode text to binary representation.
-        
-        Binary encoding is like translating text into the language of switches - 
-        each character becomes a series of 1s and 0s (on/off). It's the most 
-        fundamental way computers represent data internally.
+        Decode bytes using the specified encoding, without any str conversion.
         
         Args:
-            text: The string to encode
+            data: Bytes to decode
+            encoding: Encoding type (base64, hex, binary, etc.)
             
         Returns:
-            Binary string (space-separated bytes)
+            Decoded bytes
+            
+        Raises:
+            ValueError: If encoding type does not support bytes
         """
-        return ' '.join(format(byte, '08b') for byte in text.encode('utf-8'))
+        func = self._bytes_decoders.get(encoding)
+        if func is None:
+            raise ValueError(f"Unsupported bytes encoding: {encoding}")
+        return func(data)
     
-    @staticmethod
-    def binary_decode(encoded: str) -> str:
+    def supports_bytes(self, encoding: str) -> bool:
         """
-        Decode binary text.
+        Check whether an encoding has bytes-in/bytes-out variants.
         
         Args:
-            encoded: Binary string (space-separated bytes)
+            encoding: Encoding type
             
         Returns:
-            Decoded string
+            True if encode_bytes() and decode_bytes() accept this encoding
         """
-        # Remove any extra whitespace and split by spaces
-        binary_bytes = encoded.strip().split()
-        # Convert each binary string to a byte
-        byte_array = bytearray(int(b, 2) for b in binary_bytes)
-        return byte_array.decode('utf-8')
+        return encoding in self._bytes_encoders
     
-    @staticmethod
-    def octal_encode(text: str) -> str:
+    def list_encodings(self) -> Mapping[str, str]:
         """
-        Encode text to octal representation.
-        
-        Octal encoding is like binary's older sibling - instead of using just 0 and 1,
-        it uses digits 0-7. It's like counting on your fingers if you only had 8 fingers.
-        Historically used in Unix file permissions (e.g., chmod 755).
+        Get a list of all supported encodings with descriptions.
         
-        Args:
-            text: The string to encode
-            
         Returns:
-            Octal string (space-separated bytes)
+            Read-only mapping of encoding names to their descriptions
         """
-        return ' '.join(format(byte, '03o') for byte in text.encode('utf-8'))
+        return self._descriptions
     
-    @staticmethod
-    def octal_decode(encoded: str) -> str:
+    def cache_clear(self) -> None:
         """
-        Decode octal text.
+        Discard all memoised encode/decode results.
         
-        Args:
-            encoded: Octal string (space-separated bytes)
-            
-        Returns:
-            Decoded string
+        The cache is shared, so this clears it for every instance.
         """
-        # Remove any extra whitespace and split by spaces
-        octal_bytes = encoded.strip().split()
-        # Convert each octal string to a byte
-        byte_array = bytearray(int(o, 8) for o in octal_bytes)
-        return byte_array.decode('utf-8')
+        _cached_apply.cache_clear()
 
 
-class EncoderDecoder:
+# Encoders that can process piped input incrementally, mapped to a
+# bytes -> bytes function and the input block size it encodes without
+# padding. Feeding whole blocks keeps the concatenated output identical to
+# encoding the entire input at once.
+_STREAM_ENCODERS = {
+    'base64': (base64_encode_bytes, 3),
+    'base32': (base32_encode_bytes, 5),
+    'hex': (hex_encode_bytes, 1),
+    'ascii85': (ascii85_encode_bytes, 4),
+}
+
+# Number of bytes read from stdin per streaming step
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _stdin_decoder():
     """
-    Main class that orchestrates encoding and decoding operations.
-    
-    This is like the conductor of an orchestra - it coordinates all the different
-    encoding methods and provides a unified interface to use them.
+    Return an incremental decoder that turns sys.stdin's bytes into the same
+    text that reading sys.stdin would return.
     """
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding)(sys.stdin.errors)
+    if os.name == 'nt':
+        # sys.stdin only translates line endings on Windows
+        decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+    return decoder
+
+
+def _reposition(error: UnicodeError, offset: int) -> UnicodeError:
+    """
+    Return a UnicodeError with the message of error, but with the position
+    it reports moved forward by offset.
+    """
+    old = f"position {error.start}"
+    new = f"position {offset + error.start}"
+    if error.end - error.start > 1:
+        old += f"-{error.end - 1}"
+        new += f"-{offset + error.end - 1}"
+    return UnicodeError(str(error).replace(old, new, 1))
+
+
+def _stream_encode(encode: Callable, block_size: int, infile, outfile,
+                   decoder=None, chunk_size: int = _STREAM_CHUNK_SIZE) -> None:
+    """
+    Encode a stream of text chunk by chunk.
+
+    The result is identical to decoding all of infile, stripping it with
+    str.strip() and encoding it as UTF-8 in one go, but only one chunk of
+    input is held in memory, plus any whitespace run that has not yet been
+    followed by more text.
+
+    Output is written as soon as it is encoded, so if infile turns out not to
+    be valid text, whatever was encoded before the error has already been
+    written. The error reports where the problem is from the start of the
+    input: in bytes for undecodable input, and in characters of the stripped
+    text for text that cannot be encoded as UTF-8.
+
+    Args:
+        encode: Function that encodes bytes to bytes
+        block_size: Number of input bytes the encoder consumes per block
+        infile: Binary file object to read from
+        outfile: Binary file object to write to
+        decoder: Incremental decoder for infile's bytes (default: strict UTF-8)
+        chunk_size: Number of bytes to read at a time
+    """
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = b''  # encoded input shorter than one block
+    held = []      # whitespace that is only written if more text follows
+    started = False
+    consumed = 0   # bytes of infile passed to the decoder
+    encoded = 0    # characters of stripped text encoded as UTF-8
+    final = False
+    while not final:
+        chunk = infile.read(chunk_size)
+        final = not chunk
+        # The decoder may still hold the start of a sequence from the last chunk
+        offset = consumed - len(decoder.getstate()[0])
+        try:
+            text = decoder.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            raise _reposition(e, offset) from None
+        consumed += len(chunk)
+        if not started:
+            text = text.lstrip()
+            if not text:
+                continue
+            started = True
+        body = text.rstrip()
+        if not body:
+            held.append(text)
+            continue
+        held.append(body)
+        ready = ''.join(held)
+        try:
+            data = pending + ready.encode('utf-8')
+        except UnicodeEncodeError as e:
+            raise _reposition(e, encoded) from None
+        encoded += len(ready)
+        held = [text[len(body):]]
+        cut = len(data) - len(data) % block_size
+        if cut:
+            outfile.write(encode(data[:cut]))
+        pending = data[cut:]
+    if pending:
+        outfile.write(encode(pending))
+
+
+def _run(text: str, encoding: str, decode: bool) -> None:
+    """
+    Encode or decode text for the command line and print the result.
     
-    def __init__(self):
-        self.encoder = TextEncoder()
-        self.encodings: Dict[str, Dict[str, Callable]] = {
-            'base64': {
-                'encode': self.encoder.base64_encode,
-                'decode': self.encoder.base64_decode,
-                'description': 'Base64 encoding (RFC 4648)'
-            },
-            'base32': {
-                'encode': self.encoder.base32_encode,
-                'decode': self.encoder.base32_decode,
-                'description': 'Base32 encoding (RFC 4648)'
-            },
-            'hex': {
-                'encode': self.encoder.hex_encode,
-                'decode': self.encoder.hex_decode,
-                'description': 'Hexadecimal encoding'
-            },
-            'url': {
-                'encode': self.encoder.url_encode,
-                'decode': self.encoder.url_decode,
-                'description': 'URL/Percent encoding (RFC 3986)'
-            },
-            'html': {
-                'encode': self.encoder.html_encode,
-                'decode': self.encoder.html_decode,
-                'description': 'HTML entity encoding'
-            },
-            'rot13': {
-                'encode': self.encoder.rot13_encode,
-                'decode': self.encoder.rot13_decode,
-                'description': 'ROT13 substitution cipher'
-            },
-            'ascii85': {
-                'encode': self.encoder.ascii85_encode,
-                'decode': self.encoder.ascii85_decode,
-                'description': 'ASCII85/Base85 encoding'
-            },
-            'binary': {
-                'encode': self.encoder.binary_encode,
-                'decode': self.encoder.binary_decode,
-                'description': 'Binary representation (base 2)'
-            },
-            'octal': {
-                'encode': self.encoder.octal_encode,
-                'decode': self.encoder.octal_decode,
-                'description': 'Octal representation (base 8)'
-            }
-        }
-    
-    def encode(self, text: str, encoding: str) -> str:
-        """
-        Encode text using the specified encoding.
-        
-        Args:
-            text: Text to encode
-            encoding: Encoding type (base64, hex, url, etc.)
-            
-        Returns:
-            Encoded string
-            
-        Raises:
-            ValueError: If encoding type is not supported
-        """
-        if encoding not in self.encodings:
-            raise ValueError(f"Unsupported encoding: {encoding}")
-        return self.encodings[encoding]['encode'](text)
-    
-    def decode(self, text: str, encoding: str) -> str:
-        """
-        Decode text using the specified encoding.
-        
-        Args:
-            text: Text to decode
-            encoding: Encoding type (base64, hex, url, etc.)
-            
-        Returns:
-            Decoded string
-            
-        Raises:
-            ValueError: If encoding type is not supported
-        """
-        if encoding not in self.encodings:
-            raise ValueError(f"Unsupported encoding: {encoding}")
-        return self.encodings[encoding]['decode'](text)
-    
-    def list_encodings(self) -> Dict[str, str]:
-        """
-        Get a list of all supported encodings with descriptions.
-        
-        Returns:
-            Dictionary of encoding names and their descriptions
-        """
-        return {name: info['description'] for name, info in self.encodings.items()}
+    Errors are reported on stderr with exit status 1. Both the argparse path
+    and the fast path of main() come through here, so they behave the same.
+    """
+    encoder_decoder = EncoderDecoder()
+    # stdout may have been replaced by an object without a binary buffer
+    stdout = getattr(sys.stdout, 'buffer', None)
+    try:
+        if decode:
+            print(encoder_decoder.decode(text, encoding))
+        elif stdout is not None and encoder_decoder.supports_bytes(encoding):
+            # Encoded output is pure ASCII, so skip the str round trip
+            result = encoder_decoder.encode_bytes(text.encode('utf-8'), encoding)
+            sys.stdout.flush()
+            stdout.write(result)
+            # Let print() end the line so that it gets the platform's newline
+            print()
+        else:
+            print(encoder_decoder.encode(text, encoding))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def main():
     """
     Main function that handles command-line interface.
     """
+    # Fast path for the common "-e TYPE TEXT" / "-d TYPE TEXT" invocation,
+    # which does not need argparse. Anything else, including text that could
+    # be mistaken for an option, falls through to the full parser below.
+    argv = sys.argv[1:]
+    if (len(argv) == 3 and argv[0] in ('-e', '--encode', '-d', '--decode')
+            and argv[1] in _ENCODERS and argv[2] and not argv[2].startswith('-')):
+        flag, encoding, text = argv
+        _run(text, encoding, decode=flag in ('-d', '--decode'))
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Encode and decode text using various encoding schemes',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -413,6 +1153,10 @@ Examples:
   %(prog)s -e hex "Secret Message"
   %(prog)s --list
   echo "Hello" | %(prog)s -e base64
+
+Piped input is encoded as it is read with base64, base32, hex and ascii85.
+If it turns out not to be valid text, output written before the error is
+kept; check the exit status.
         """
     )
     
@@ -442,12 +1186,10 @@ Examples:
     
     args = parser.parse_args()
     
-    encoder_decoder = EncoderDecoder()
-    
     # List encodings if requested
     if args.list:
         print("Available encodings:")
-        for name, description in encoder_decoder.list_encodings().items():
+        for name, description in _DESCRIPTIONS.items():
             print(f"  {name:<12} - {description}")
         return
     
@@ -459,22 +1201,30 @@ Examples:
     if args.encode and args.decode:
         parser.error("Cannot specify both --encode and --decode")
     
+    # Stream piped input straight through encoders that support it, unless
+    # stdin or stdout has been replaced by an object without a binary buffer
+    stdin = getattr(sys.stdin, 'buffer', None)
+    stdout = getattr(sys.stdout, 'buffer', None)
+    if (not args.text and args.encode in _STREAM_ENCODERS
+            and stdin is not None and stdout is not None):
+        encode, block_size = _STREAM_ENCODERS[args.encode]
+        try:
+            sys.stdout.flush()
+            _stream_encode(encode, block_size, stdin, stdout, _stdin_decoder())
+            # Let print() end the line so that it gets the platform's newline
+            print()
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Get text from argument or stdin
     if args.text:
         text = args.text
     else:
         text = sys.stdin.read().strip()
     
-    try:
-        if args.encode:
-            result = encoder_decoder.encode(text, args.encode)
-            print(result)
-        else:
-            result = encoder_decoder.decode(text, args.decode)
-            print(result)
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    _run(text, args.encode or args.decode, decode=not args.encode)
 
 
 if __name__ == '__main__':